@@ -10,19 +10,176 @@ Usage:
 
 import sys
 import argparse
+import asyncio
+import functools
+import time
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import vertexai
-from vertexai import agent_engines
-
+from src import utils
 from src.config import get_config
-from src.utils import print_header, print_response, print_info, print_error
+from src.utils import print_header, print_info, print_error
+
+
+# Coalesce streamed chunks: flush after this many chunks or this many
+# seconds, whichever comes first.
+FLUSH_EVERY = 16
+FLUSH_INTERVAL = 0.05
+
+# Tracks whether vertexai.init has already run in this process
+_initialized = False
+
+# Completed responses keyed by (session_id, normalized prompt), so a
+# repeated prompt skips the round trip to Gemini entirely.
+_response_cache: dict = {}
+_RESPONSE_CACHE_MAX = 128
+
+# Prompts mentioning these words hit non-deterministic tools (e.g. the
+# clock), so they always bypass the cache.
+_CACHE_BYPASS_WORDS = ("time", "now")
+
+
+# Sessions created in this process, keyed by user id, so repeated
+# queries for one user don't bootstrap a new server-side session.
+_sessions: dict = {}
+
+
+def get_session_id(remote_agent, user_id: str) -> str:
+    """Create (or reuse) a session for the given user."""
+    session_id = _sessions.get(user_id)
+    if session_id is None:
+        session = remote_agent.create_session(user_id=user_id)
+        session_id = session["id"]
+        _sessions[user_id] = session_id
+    return session_id
+
+
+def _cache_key(session_id: str, message: str):
+    """Normalize a prompt into a cache key, or None if uncacheable."""
+    normalized = " ".join(message.lower().split())
+    if any(word in normalized for word in _CACHE_BYPASS_WORDS):
+        return None
+    return (session_id, normalized)
+
+
+def initialize_vertexai() -> None:
+    """Initialize the Vertex AI SDK once per process."""
+    global _initialized
+    if _initialized:
+        return
+
+    # Deferred so --help and argument errors don't pay the SDK import
+    import vertexai
+
+    config = get_config()
+    vertexai.init(
+        project=config.project_id,
+        location=config.location,
+    )
+    _initialized = True
+
+
+@functools.lru_cache(maxsize=4)
+def _get_remote_agent(resource_name: str):
+    """Fetch and cache the deployed agent handle.
+
+    Reusing the handle avoids re-establishing the underlying client
+    channel on every query.
+    """
+    from vertexai import agent_engines
+
+    initialize_vertexai()
+    return agent_engines.get(resource_name)
+
+
+async def stream_agent_response(remote_agent, **kwargs):
+    """Yield response chunks without blocking the event loop.
+
+    Prefers `async_stream_query` when the deployed agent exposes it.
+    Otherwise drives the synchronous `stream_query` generator from a
+    worker thread, so concurrent sessions can still overlap under
+    `asyncio.gather`.
+    """
+    if hasattr(remote_agent, "async_stream_query"):
+        async for chunk in remote_agent.async_stream_query(**kwargs):
+            yield chunk
+    else:
+        iterator = iter(remote_agent.stream_query(**kwargs))
+        sentinel = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, sentinel)
+            if chunk is sentinel:
+                break
+            yield chunk
+
+
+async def stream_response(remote_agent, **kwargs) -> str:
+    """Stream a query, printing chunks as they arrive.
+
+    Chunks are coalesced in small batches so terminal writes don't
+    happen per token, but nothing waits for the full generation —
+    the user sees output at first-token latency. Returns the full
+    response text so callers can cache it.
+    """
+    console = utils.console
+    parts = []
+    buf = []
+    last_flush = time.monotonic()
+    async for chunk in stream_agent_response(remote_agent, **kwargs):
+        content = getattr(chunk, "content", None)
+        if not content:
+            continue
+        buf.append(content)
+        now = time.monotonic()
+        if len(buf) >= FLUSH_EVERY or now - last_flush > FLUSH_INTERVAL:
+            batch = "".join(buf)
+            # Model output is raw text; never interpret it as rich markup
+            console.print(batch, end="", soft_wrap=True, markup=False, highlight=False)
+            parts.append(batch)
+            buf.clear()
+            last_flush = now
+
+    if buf:
+        batch = "".join(buf)
+        console.print(batch, end="", soft_wrap=True, markup=False, highlight=False)
+        parts.append(batch)
+    console.print()
+    return "".join(parts)
+
+
+async def query_agent(
+    remote_agent,
+    user_id: str,
+    session_id: str,
+    message: str,
+    use_cache: bool = True,
+) -> None:
+    """Send one prompt, reusing a cached response for repeated prompts."""
+    key = _cache_key(session_id, message) if use_cache else None
+
+    if key is not None and key in _response_cache:
+        console = utils.console
+        console.print(
+            _response_cache[key], soft_wrap=True, markup=False, highlight=False
+        )
+        return
+
+    full_response = await stream_response(
+        remote_agent,
+        user_id=user_id,
+        session_id=session_id,
+        message=message,
+    )
 
+    if key is not None and full_response:
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = full_response
 
-def main():
+
+async def main():
     """Query a deployed agent."""
     parser = argparse.ArgumentParser(description="Query a deployed agent")
     parser.add_argument(
@@ -34,54 +191,60 @@ def main():
         "--query",
         help="Single query to send (interactive mode if not provided)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the agent, even for repeated prompts",
+    )
+    parser.add_argument(
+        "--session-id",
+        help="Attach to an existing session instead of creating a new one",
+    )
+    parser.add_argument(
+        "--user-id",
+        default="user-1",
+        help="User id for the conversation (default: user-1)",
+    )
 
     args = parser.parse_args()
 
     print_header("Query Deployed Agent")
 
-    config = get_config()
-
-    # Initialize Vertex AI
-    vertexai.init(
-        project=config.project_id,
-        location=config.location,
-    )
-
-    # Get the deployed agent
+    # Get the deployed agent (cached for reuse across queries)
     print_info(f"Connecting to agent: {args.resource_name}")
 
     try:
-        remote_agent = agent_engines.get(args.resource_name)
+        remote_agent = _get_remote_agent(args.resource_name)
     except Exception as e:
         print_error(f"Failed to get agent: {str(e)}")
         return
 
-    # Create a session for the conversation
-    session = remote_agent.create_session(user_id="user-1")
-    print_info(f"Session created: {session['id']}")
+    # Attach to the given session, or create one for the conversation
+    if args.session_id:
+        session_id = args.session_id
+        _sessions[args.user_id] = session_id
+        print_info(f"Reusing session: {session_id}")
+    else:
+        session_id = get_session_id(remote_agent, args.user_id)
+        print_info(f"Session created: {session_id}")
     print()
 
     if args.query:
         # Single query mode
-        response = remote_agent.stream_query(
-            user_id="user-1",
-            session_id=session["id"],
+        await query_agent(
+            remote_agent,
+            user_id=args.user_id,
+            session_id=session_id,
             message=args.query,
+            use_cache=not args.no_cache,
         )
-
-        full_response = ""
-        for chunk in response:
-            if hasattr(chunk, "content") and chunk.content:
-                full_response += chunk.content
-
-        print_response(full_response)
     else:
         # Interactive mode
         print_info("Interactive mode. Type 'quit' or 'exit' to stop.\n")
 
         while True:
             try:
-                user_input = input("You: ").strip()
+                user_input = (await asyncio.to_thread(input, "You: ")).strip()
 
                 if user_input.lower() in ["quit", "exit", "q"]:
                     print_info("Goodbye!")
@@ -90,19 +253,13 @@ def main():
                 if not user_input:
                     continue
 
-                response = remote_agent.stream_query(
-                    user_id="user-1",
-                    session_id=session["id"],
+                await query_agent(
+                    remote_agent,
+                    user_id=args.user_id,
+                    session_id=session_id,
                     message=user_input,
+                    use_cache=not args.no_cache,
                 )
-
-                full_response = ""
-                for chunk in response:
-                    if hasattr(chunk, "content") and chunk.content:
-                        full_response += chunk.content
-
-                if full_response:
-                    print_response(full_response)
                 print()
 
             except KeyboardInterrupt:
@@ -112,6 +269,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
 
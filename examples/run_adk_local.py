@@ -8,7 +8,9 @@ Usage:
     python examples/run_adk_local.py
 """
 
+import asyncio
 import sys
+import time
 from pathlib import Path
 
 # Add src to path for imports
@@ -18,12 +20,41 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
+from src import utils
 from src.agents.adk_agent import create_adk_agent
 from src.config import get_config
-from src.utils import print_header, print_response, print_info
+from src.utils import print_header, print_info
 
+# Coalesce streamed tokens: flush after this many events or this many
+# seconds, whichever comes first.
+FLUSH_EVERY = 16
+FLUSH_INTERVAL = 0.05
 
-def main():
+_USER_ROLE = "user"
+
+
+def make_user_content(text: str) -> types.Content:
+    """Build a user-turn Content for the runner.
+
+    The role/parts shape is fixed, so skip pydantic validation via
+    model_construct when available; otherwise fall back to the normal
+    constructors.
+    """
+    if hasattr(types.Part, "model_construct"):
+        part = types.Part.model_construct(text=text)
+        return types.Content.model_construct(role=_USER_ROLE, parts=[part])
+    return types.Content(role=_USER_ROLE, parts=[types.Part(text=text)])
+
+
+def collect_text(event) -> str:
+    """Join the text parts of a streaming event into one string."""
+    content = getattr(event, "content", None)
+    if not content:
+        return ""
+    return "".join(p.text for p in content.parts if getattr(p, "text", None))
+
+
+async def main():
     """Run the ADK agent in an interactive loop."""
     print_header("ADK Agent - Local Testing")
 
@@ -55,7 +86,7 @@ def main():
 
     while True:
         try:
-            user_input = input("You: ").strip()
+            user_input = (await asyncio.to_thread(input, "You: ")).strip()
 
             if user_input.lower() in ["quit", "exit", "q"]:
                 print_info("Goodbye!")
@@ -65,25 +96,45 @@ def main():
                 continue
 
             # Create the content for the agent
-            content = types.Content(
-                role="user",
-                parts=[types.Part(text=user_input)],
-            )
-
-            # Run the agent
-            response_text = ""
-            for event in runner.run(
+            content = make_user_content(user_input)
+
+            # Run the agent, printing coalesced token batches as they
+            # arrive instead of waiting for the full response
+            console = utils.console
+            buf = []
+            last_flush = time.monotonic()
+            async for event in runner.run_async(
                 user_id="local-user",
                 session_id=session.id,
                 new_message=content,
             ):
-                if hasattr(event, "content") and event.content:
-                    for part in event.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            response_text += part.text
-
-            if response_text:
-                print_response(response_text)
+                text = collect_text(event)
+                if not text:
+                    continue
+                buf.append(text)
+                now = time.monotonic()
+                if len(buf) >= FLUSH_EVERY or now - last_flush > FLUSH_INTERVAL:
+                    # Model output is raw text; never interpret it as
+                    # rich markup
+                    console.print(
+                        "".join(buf),
+                        end="",
+                        soft_wrap=True,
+                        markup=False,
+                        highlight=False,
+                    )
+                    buf.clear()
+                    last_flush = now
+
+            if buf:
+                console.print(
+                    "".join(buf),
+                    end="",
+                    soft_wrap=True,
+                    markup=False,
+                    highlight=False,
+                )
+            console.print()
             print()
 
         except KeyboardInterrupt:
@@ -93,6 +144,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
 
@@ -7,41 +7,21 @@ and conversation management.
 Includes MCP (Model Context Protocol) integration for Google Cloud Storage.
 """
 
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
-
-
-# ============== Basic Tools ==============
-
-def get_current_time() -> str:
-    """Get the current date and time.
-
-    Returns:
-        A string with the current date and time.
-    """
-    from datetime import datetime
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
+import asyncio
 
-def calculate(expression: str) -> str:
-    """Evaluate a mathematical expression safely.
+from google.adk.agents import Agent
 
-    Args:
-        expression: A mathematical expression to evaluate (e.g., "2 + 2 * 3").
+try:
+    from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
+except ImportError:  # MCP support is optional in some ADK builds
+    MCPToolset = None
+    StdioServerParameters = None
 
-    Returns:
-        The result of the calculation as a string.
-    """
-    allowed_chars = set("0123456789+-*/(). ")
-    if not all(c in allowed_chars for c in expression):
-        return "Error: Invalid characters in expression. Only numbers and basic operators allowed."
+from src.agents.tools import CALC_TOOL, GET_TIME_TOOL
 
-    try:
-        result = eval(expression)  # Safe because we validated the input
-        return str(result)
-    except Exception as e:
-        return f"Error: {str(e)}"
+# Stateless, so built once; agent constructors copy it so caller-side
+# appends can't mutate module state.
+_BASIC_TOOLS = (GET_TIME_TOOL, CALC_TOOL)
 
 
 # ============== Agent Creation ==============
@@ -55,10 +35,7 @@ def create_adk_agent(model_name: str = "gemini-2.0-flash") -> Agent:
     Returns:
         A configured ADK Agent instance.
     """
-    tools = [
-        FunctionTool(get_current_time),
-        FunctionTool(calculate),
-    ]
+    tools = list(_BASIC_TOOLS)
 
     agent = Agent(
         name="assistant",
@@ -90,21 +67,32 @@ async def create_adk_agent_with_gcs_mcp(model_name: str = "gemini-2.0-flash") ->
 
     Returns:
         A configured ADK Agent instance with GCS tools.
+
+    Raises:
+        ImportError: If the installed ADK build has no MCP support.
     """
-    # Basic tools
-    basic_tools = [
-        FunctionTool(get_current_time),
-        FunctionTool(calculate),
-    ]
-
-    # Connect to the GCS MCP server using npx (auto-downloads if needed)
-    gcs_mcp_tools, exit_stack = await MCPToolset.from_server(
-        connection_params=StdioServerParameters(
-            command="npx",
-            args=["-y", "@google-cloud/storage-mcp"],
+    if MCPToolset is None:
+        raise ImportError(
+            "MCP support is not available in this google-adk installation."
+        )
+
+    # Start the GCS MCP server via npx (auto-downloads if needed) in the
+    # background while the basic tools are assembled, so the npm fetch
+    # overlaps local work instead of serializing before it
+    mcp_task = asyncio.create_task(
+        MCPToolset.from_server(
+            connection_params=StdioServerParameters(
+                command="npx",
+                args=["-y", "@google-cloud/storage-mcp"],
+            )
         )
     )
 
+    # Basic tools
+    basic_tools = list(_BASIC_TOOLS)
+
+    gcs_mcp_tools, exit_stack = await mcp_task
+
     # Combine basic tools with MCP tools
     all_tools = basic_tools + gcs_mcp_tools
 
@@ -133,6 +121,24 @@ Always be accurate, helpful, and concise.""",
     return agent, exit_stack
 
 
+async def prewarm_mcp() -> None:
+    """Warm the npm cache for the GCS MCP server ahead of time.
+
+    The first `npx -y @google-cloud/storage-mcp` run downloads the
+    package, which can take tens of seconds. Running this early (e.g.
+    at process start) makes the later agent construction near-instant.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "npx",
+        "-y",
+        "@google-cloud/storage-mcp",
+        "--version",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await process.wait()
+
+
 # ============== Agent for ADK folder structure ==============
 # This is used by `adk web` command
 
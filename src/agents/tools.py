@@ -0,0 +1,88 @@
+"""Shared tools for ADK agents.
+
+Tool functions and their `FunctionTool` wrappers live here so every
+agent references a single instance created once at import, instead of
+each module re-defining the functions and re-wrapping them.
+"""
+
+import ast
+import functools
+import operator
+from datetime import datetime
+
+from google.adk.tools import FunctionTool
+
+# Deletes every allowed character in C; anything surviving translate()
+# is disallowed. Cheaper than a regex or per-char membership scan.
+_ALLOWED_TABLE = str.maketrans("", "", "0123456789+-*/(). ")
+
+# Only plain arithmetic is evaluated; notably no Pow, so inputs like
+# 2**999999 are rejected instead of pinning the CPU.
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_MAX_MAGNITUDE = 10**18
+
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        result = _BIN_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        result = _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    else:
+        raise ValueError("Unsupported expression")
+    if abs(result) > _MAX_MAGNITUDE:
+        raise ValueError("Result too large")
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_eval(expression: str):
+    """Evaluate an arithmetic expression over a whitelisted AST.
+
+    Pure function of the expression string, so repeated prompts hit the
+    LRU cache instead of re-parsing.
+    """
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
+
+def get_current_time() -> str:
+    """Get the current date and time.
+
+    Returns:
+        A string with the current date and time.
+    """
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def calculate(expression: str) -> str:
+    """Evaluate a mathematical expression safely.
+
+    Args:
+        expression: A mathematical expression to evaluate (e.g., "2 + 2 * 3").
+
+    Returns:
+        The result of the calculation as a string.
+    """
+    if expression.translate(_ALLOWED_TABLE):
+        return "Error: Invalid characters in expression. Only numbers and basic operators allowed."
+
+    try:
+        result = _safe_eval(expression)
+        return str(result)
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+# Shared tool instances, wrapped once at import
+GET_TIME_TOOL = FunctionTool(get_current_time)
+CALC_TOOL = FunctionTool(calculate)
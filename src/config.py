@@ -1,5 +1,6 @@
 """Configuration management for Agent Engine experiments."""
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -10,9 +11,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """Application configuration.
+
+    Frozen and slotted: instances are immutable, hashable, and skip the
+    per-instance __dict__ allocation.
+    """
 
     # Google Cloud settings
     project_id: str
@@ -27,23 +32,51 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Create config from environment variables."""
-        project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
+        # Bind the environ proxy once instead of re-resolving os.environ
+        # for each lookup
+        env = os.environ
+        project_id = env.get("GOOGLE_CLOUD_PROJECT")
         if not project_id:
             raise ValueError(
                 "GOOGLE_CLOUD_PROJECT environment variable is required. "
                 "Copy env.example to .env and set your project ID."
             )
 
-        return cls(
-            project_id=project_id,
-            location=os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"),
-            staging_bucket=os.getenv("AGENT_ENGINE_STAGING_BUCKET"),
-            model_name=os.getenv("MODEL_NAME", "gemini-2.0-flash"),
+        return _build_config(
+            project_id,
+            env.get("GOOGLE_CLOUD_LOCATION", "us-central1"),
+            env.get("AGENT_ENGINE_STAGING_BUCKET"),
+            env.get("MODEL_NAME", "gemini-2.0-flash"),
         )
 
 
+@functools.lru_cache(maxsize=8)
+def _build_config(
+    project_id: str,
+    location: str,
+    staging_bucket: Optional[str],
+    model_name: str,
+) -> Config:
+    """Construct a Config, memoized on the env values themselves.
+
+    Repeated ``from_env`` calls with unchanged environment reuse one
+    instance instead of re-allocating the dataclass.
+    """
+    return Config(
+        project_id=project_id,
+        location=location,
+        staging_bucket=staging_bucket,
+        model_name=model_name,
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get application configuration."""
+    """Get application configuration.
+
+    Cached for the life of the process; call ``get_config.cache_clear()``
+    in tests that mutate the environment.
+    """
     return Config.from_env()
 
 
@@ -4,37 +4,39 @@ This module provides functions to deploy agents to Google Cloud's
 Vertex AI Agent Engine for production use.
 """
 
-import os
-import vertexai
-from vertexai import agent_engines
-from rich.console import Console
-from rich.panel import Panel
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-console = Console()
-
-
-def print_header(title: str) -> None:
-    console.print(Panel(f"[bold cyan]{title}[/bold cyan]", expand=False))
+from __future__ import annotations
 
+import asyncio
+import functools
+import os
+from typing import TYPE_CHECKING
 
-def print_success(message: str) -> None:
-    console.print(f"[bold green]✓[/bold green] {message}")
+# One console for the whole app; vertexai/rich stay lazily imported so
+# CLI startup for `--help`, `list`, and `delete` stays cheap.
+from src.utils import (
+    _get_console,
+    print_error,
+    print_header,
+    print_info,
+    print_success,
+)
 
+if TYPE_CHECKING:
+    from vertexai import agent_engines
 
-def print_error(message: str) -> None:
-    console.print(f"[bold red]Error:[/bold red] {message}")
 
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Get configuration from environment.
 
-def print_info(message: str) -> None:
-    console.print(f"[bold blue]ℹ[/bold blue] {message}")
+    Parses .env once and caches the result; deploy_agent alone reads the
+    config twice per invocation. Call ``get_config.cache_clear()`` in
+    tests that mutate the environment.
+    """
+    from dotenv import load_dotenv
 
+    load_dotenv()
 
-def get_config():
-    """Get configuration from environment."""
     project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
     if not project_id:
         raise ValueError("GOOGLE_CLOUD_PROJECT environment variable is required.")
@@ -46,14 +48,25 @@ def get_config():
     }
 
 
+# Tracks whether vertexai.init has already run in this process
+_initialized = False
+
+
 def initialize_vertexai():
-    """Initialize the Vertex AI SDK."""
+    """Initialize the Vertex AI SDK (no-op if already initialized)."""
+    global _initialized
+    if _initialized:
+        return
+
+    import vertexai
+
     config = get_config()
     vertexai.init(
         project=config["project_id"],
         location=config["location"],
         staging_bucket=config["staging_bucket"],
     )
+    _initialized = True
     print_success(
         f"Initialized Vertex AI for project '{config['project_id']}' in '{config['location']}'"
     )
@@ -65,11 +78,56 @@ def create_agent_for_deployment(model_name: str = "gemini-2.0-flash"):
     This function creates the agent inline to avoid import issues
     when deployed to Agent Engine.
     """
+    import ast
+    import operator
     from google.adk.agents import Agent
     from google.adk.tools import FunctionTool
     from datetime import datetime
 
     # Define tools inline (no external imports)
+    # Deletes every allowed character in C; anything surviving
+    # translate() is disallowed
+    allowed_table = str.maketrans("", "", "0123456789+-*/(). ")
+
+    # Plain arithmetic only; no Pow, so 2**999999 can't pin the CPU
+    bin_ops = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+    }
+    unary_ops = {
+        ast.UAdd: operator.pos,
+        ast.USub: operator.neg,
+    }
+    max_magnitude = 10**18
+
+    def eval_node(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in bin_ops:
+            result = bin_ops[type(node.op)](eval_node(node.left), eval_node(node.right))
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in unary_ops:
+            result = unary_ops[type(node.op)](eval_node(node.operand))
+        else:
+            raise ValueError("Unsupported expression")
+        if abs(result) > max_magnitude:
+            raise ValueError("Result too large")
+        return result
+
+    # Plain dict cache: cloudpickle can serialize it with the agent,
+    # unlike an lru_cache wrapper
+    eval_cache = {}
+
+    def safe_eval(expression: str):
+        """Evaluate arithmetic over a whitelisted AST, cached per string."""
+        if expression in eval_cache:
+            return eval_cache[expression]
+        result = eval_node(ast.parse(expression, mode="eval").body)
+        if len(eval_cache) < 256:
+            eval_cache[expression] = result
+        return result
+
     def get_current_time() -> str:
         """Get the current date and time.
 
@@ -87,11 +145,10 @@ def create_agent_for_deployment(model_name: str = "gemini-2.0-flash"):
         Returns:
             The result of the calculation as a string.
         """
-        allowed_chars = set("0123456789+-*/(). ")
-        if not all(c in allowed_chars for c in expression):
+        if expression.translate(allowed_table):
             return "Error: Invalid characters in expression."
         try:
-            result = eval(expression)
+            result = safe_eval(expression)
             return str(result)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -122,12 +179,15 @@ Always be accurate, helpful, and concise.""",
     return agent
 
 
-def deploy_agent(
+async def deploy_agent(
     display_name: str = "adk-playground-agent",
     description: str = "An ADK-based agent for experimentation",
 ) -> agent_engines.AgentEngine:
     """Deploy an ADK agent to Agent Engine.
 
+    The blocking `agent_engines.create` call runs in a worker thread,
+    so several deploys can be awaited concurrently via `asyncio.gather`.
+
     Args:
         display_name: Display name for the deployed agent.
         description: Description of the agent.
@@ -135,6 +195,8 @@ def deploy_agent(
     Returns:
         The deployed AgentEngine instance.
     """
+    from vertexai import agent_engines
+
     print_header("Deploying ADK Agent to Agent Engine")
 
     # Initialize Vertex AI
@@ -157,20 +219,31 @@ def deploy_agent(
     # Deploy to Agent Engine
     print_info("Deploying to Agent Engine (this may take a few minutes)...")
 
-    # Requirements needed in the cloud environment
+    # Requirements needed in the cloud environment. Bounded versions keep
+    # pip resolution in the build container fast and deterministic.
     requirements = [
-        "google-cloud-aiplatform[adk,agent_engines]>=1.87.0",
-        "google-adk",
-        "google-genai",
+        "google-cloud-aiplatform[adk,agent_engines]>=1.87.0,<2.0",
+        "google-adk>=0.3,<1.0",
+        "google-genai>=0.5,<2.0",
     ]
 
     try:
-        remote_agent = agent_engines.create(
-            agent_engine=agent,
-            display_name=display_name,
-            description=description,
-            requirements=requirements,
-        )
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=_get_console(),
+            transient=True,
+        ) as progress:
+            progress.add_task(f"Deploying '{display_name}'...", total=None)
+            remote_agent = await asyncio.to_thread(
+                agent_engines.create,
+                agent_engine=agent,
+                display_name=display_name,
+                description=description,
+                requirements=requirements,
+            )
 
         print_success(f"Agent deployed successfully!")
         print_info(f"Resource name: {remote_agent.resource_name}")
@@ -188,6 +261,8 @@ def list_deployed_agents() -> list:
     Returns:
         List of deployed AgentEngine instances.
     """
+    from vertexai import agent_engines
+
     print_header("Deployed Agents")
 
     initialize_vertexai()
@@ -198,6 +273,7 @@ def list_deployed_agents() -> list:
         print_info("No agents deployed yet.")
         return []
 
+    console = _get_console()
     for agent in agents:
         console.print(f"  • [cyan]{agent.display_name}[/cyan]")
         console.print(f"    Resource: {agent.resource_name}")
@@ -212,6 +288,8 @@ def delete_agent(resource_name: str) -> None:
     Args:
         resource_name: The resource name of the agent to delete.
     """
+    from vertexai import agent_engines
+
     print_header("Deleting Agent")
 
     initialize_vertexai()
@@ -235,25 +313,47 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--name",
-        help="Display name for deployment or resource name for deletion",
+        action="append",
+        help=(
+            "Display name for deployment or resource name for deletion. "
+            "May be repeated with --parallel to deploy several agents."
+        ),
     )
     parser.add_argument(
         "--description",
         default="Agent Engine playground agent",
         help="Description for the agent",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Deploy all --name agents concurrently",
+    )
 
     args = parser.parse_args()
 
     if args.action == "deploy":
-        deploy_agent(
-            display_name=args.name or "adk-playground-agent",
-            description=args.description,
-        )
+        names = args.name or ["adk-playground-agent"]
+
+        async def _deploy_all():
+            if args.parallel:
+                await asyncio.gather(
+                    *(
+                        deploy_agent(display_name=name, description=args.description)
+                        for name in names
+                    )
+                )
+            else:
+                for name in names:
+                    await deploy_agent(
+                        display_name=name, description=args.description
+                    )
+
+        asyncio.run(_deploy_all())
     elif args.action == "list":
         list_deployed_agents()
     elif args.action == "delete":
         if not args.name:
             print_error("--name (resource name) is required for deletion")
         else:
-            delete_agent(args.name)
+            delete_agent(args.name[0])
@@ -1,34 +1,61 @@
 """Utility functions for Agent Engine experiments."""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
+# Created lazily so importing this module doesn't pull in rich
+_console = None
 
-console = Console()
+
+def _get_console():
+    """Return the shared Console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name):
+    # Keep `from src.utils import console` working without importing
+    # rich at module load.
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_header(title: str) -> None:
     """Print a styled header."""
-    console.print(Panel(f"[bold cyan]{title}[/bold cyan]", expand=False))
+    from rich.panel import Panel
+
+    _get_console().print(Panel(f"[bold cyan]{title}[/bold cyan]", expand=False))
 
 
 def print_response(response: str, title: str = "Agent Response") -> None:
-    """Print an agent response with formatting."""
+    """Print an agent response with formatting.
+
+    When stdout is not a terminal (CI logs, piped output) the response
+    is written as plain text, skipping the markdown parse entirely.
+    """
+    console = _get_console()
+    if not console.is_terminal:
+        console.print(response, markup=False, highlight=False)
+        return
+
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     console.print(Panel(Markdown(response), title=title, border_style="green"))
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[bold red]Error:[/bold red] {message}")
+    _get_console().print(f"[bold red]Error:[/bold red] {message}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[bold green]✓[/bold green] {message}")
+    _get_console().print(f"[bold green]✓[/bold green] {message}")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[bold blue]ℹ[/bold blue] {message}")
-
-
+    _get_console().print(f"[bold blue]ℹ[/bold blue] {message}")
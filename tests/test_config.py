@@ -1,51 +1,57 @@
 """Tests for configuration management."""
 
-import os
-import pytest
-from unittest.mock import patch
+import re
 
+import pytest
 
-def test_config_from_env():
+from src.config import Config, _build_config
+
+# Compiled once; pytest.raises(match=...) accepts a pattern directly
+_MISSING_PROJECT_RE = re.compile(r"GOOGLE_CLOUD_PROJECT")
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Keep Config memoization from leaking between env-patching tests."""
+    _build_config.cache_clear()
+    yield
+
+
+@pytest.mark.parametrize(
+    "env, expected, raises",
+    [
+        # Fully specified environment
+        (
+            {
+                "GOOGLE_CLOUD_PROJECT": "test-project",
+                "GOOGLE_CLOUD_LOCATION": "us-west1",
+                "MODEL_NAME": "gemini-pro",
+            },
+            ("test-project", "us-west1", "gemini-pro"),
+            None,
+        ),
+        # Optional vars fall back to defaults
+        (
+            {"GOOGLE_CLOUD_PROJECT": "test-project"},
+            ("test-project", "us-central1", "gemini-2.0-flash"),
+            None,
+        ),
+        # Missing project ID raises
+        ({}, None, _MISSING_PROJECT_RE),
+    ],
+)
+def test_config_from_env(env, expected, raises, monkeypatch):
     """Test creating config from environment variables."""
-    with patch.dict(
-        os.environ,
-        {
-            "GOOGLE_CLOUD_PROJECT": "test-project",
-            "GOOGLE_CLOUD_LOCATION": "us-west1",
-            "MODEL_NAME": "gemini-pro",
-        },
-    ):
-        from src.config import Config
-
-        config = Config.from_env()
-
-        assert config.project_id == "test-project"
-        assert config.location == "us-west1"
-        assert config.model_name == "gemini-pro"
-
-
-def test_config_defaults():
-    """Test config uses defaults when optional vars not set."""
-    with patch.dict(
-        os.environ,
-        {"GOOGLE_CLOUD_PROJECT": "test-project"},
-        clear=True,
-    ):
-        from src.config import Config
-
-        config = Config.from_env()
-
-        assert config.project_id == "test-project"
-        assert config.location == "us-central1"  # default
-        assert config.model_name == "gemini-2.0-flash"  # default
-
-
-def test_config_missing_project():
-    """Test that missing project ID raises an error."""
-    with patch.dict(os.environ, {}, clear=True):
-        from src.config import Config
+    for name in ("GOOGLE_CLOUD_PROJECT", "GOOGLE_CLOUD_LOCATION", "MODEL_NAME"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
 
-        with pytest.raises(ValueError, match="GOOGLE_CLOUD_PROJECT"):
+    if raises:
+        with pytest.raises(ValueError, match=raises):
             Config.from_env()
+        return
 
+    config = Config.from_env()
 
+    assert (config.project_id, config.location, config.model_name) == expected